@@ -3,14 +3,36 @@
 
 from __future__ import annotations
 
+import ctypes
 import email
-import html
+import gc
+import hashlib
+import io
 import os
+import queue
 import re
+import shutil
 import sys
+import threading
+from bisect import bisect_right
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from collections import deque
+from contextlib import closing
 from email import policy
+from email.errors import HeaderParseError
+from email.header import Header, decode_header
+from email.parser import BytesParser
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 try:
     from reportlab.lib.colors import HexColor
@@ -19,17 +41,25 @@ try:
     from reportlab.lib.units import mm
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab.pdfbase.pdfmetrics import stringWidth
     from reportlab.platypus import (
         HRFlowable,
         Paragraph,
+        Preformatted,
         SimpleDocTemplate,
         Spacer,
     )
 except ImportError:
     sys.exit("reportlab が必要です: pip install reportlab")
 
-pdfmetrics.registerFont(UnicodeCIDFont("HeiseiKakuGo-W5"))
-pdfmetrics.registerFont(UnicodeCIDFont("HeiseiMin-W3"))
+
+def _register_fonts() -> None:
+    """Register the CID fonts used by the styles below (idempotent)."""
+    registered = pdfmetrics.getRegisteredFontNames()
+    for name in ("HeiseiKakuGo-W5", "HeiseiMin-W3"):
+        if name not in registered:
+            pdfmetrics.registerFont(UnicodeCIDFont(name))
+
 
 # ── Styles ────────────────────────────────────
 
@@ -57,105 +87,510 @@ STYLE_BODY = ParagraphStyle(
     spaceAfter=1 * mm,
 )
 
+# Flowables themselves are not shared between stories: reportlab marks a
+# flowable that gets pushed to the next frame (``_postponed``) and raises
+# LayoutError if the same instance is pushed again, so only the constant
+# parameters are built once.
+HR_COLOR = HexColor("#cccccc")
+GAP_SECTION = 5 * mm
+GAP_BLANK_LINE = 3 * mm
+
+PAGE_LAYOUT = {
+    "pagesize": A4,
+    "topMargin": 20 * mm,
+    "bottomMargin": 20 * mm,
+    "leftMargin": 20 * mm,
+    "rightMargin": 20 * mm,
+}
+# Text width inside SimpleDocTemplate's frame (6pt padding on each side).
+BODY_WIDTH = A4[0] - PAGE_LAYOUT["leftMargin"] - PAGE_LAYOUT["rightMargin"] - 12
+
+# Bodies over either limit (logs, dumps) are laid out as Preformatted blocks
+# of PREFORMATTED_CHUNK_LINES lines instead of one Paragraph per line.
+LONG_BODY_CHARS = 50_000
+LONG_BODY_LINES = 1000
+PREFORMATTED_CHUNK_LINES = 100
+
 # ── EML parsing ──────────────────────────────
 
 _STRIP_HTML = re.compile(r"<[^>]+>")
+_HEADER_FOLD = re.compile(r"\r?\n(?=[ \t])")
+_QUOTED_NAME = re.compile(r'"([^"\\]*)"(?=\s*<)')
+_NAME_SPECIALS = frozenset('()<>@,;:\\".[]')
+
+# Tried in order when the declared charset is missing, wrong or unknown.
+_FALLBACK_CHARSETS = ("utf-8", "iso-2022-jp", "cp932", "euc-jp")
+
+
+def _decode_bytes(data: bytes, charset: str | None) -> str:
+    """Decode *data* using *charset*, falling back to common Japanese encodings."""
+    charset = (charset or "utf-8").lower()
+    if charset in ("us-ascii", "ascii"):
+        charset = "utf-8"  # superset, and copes with undeclared 8-bit text
+    try:
+        return data.decode(charset)
+    except (LookupError, UnicodeDecodeError):
+        pass
+
+    for enc in _FALLBACK_CHARSETS:
+        if enc == charset:
+            continue
+        try:
+            return data.decode(enc)
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="replace")
+
+
+def _decode_mime_header(value: str | Header | None) -> str:
+    """Decode a raw header value, including RFC 2047 encoded words."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        value = _HEADER_FOLD.sub("", value)
+        if "=?" not in value:
+            return value  # nothing encoded, skip decode_header()
+    try:
+        chunks = decode_header(value)
+    except HeaderParseError:
+        return str(value)  # malformed encoded word: show the header as-is
+    # Header objects (raw 8-bit values) still carry their folds.
+    return _HEADER_FOLD.sub(
+        "",
+        "".join(
+            chunk if isinstance(chunk, str) else _decode_bytes(chunk, charset)
+            for chunk, charset in chunks
+        ),
+    )
+
+
+def _unquote_names(value: str) -> str:
+    """Drop quotes around display names that do not need them.
+
+    Matches how policy.default rendered address headers: ``"Jörg" <j@x>``
+    becomes ``Jörg <j@x>``, while ``"Doe, John" <d@x>`` keeps its quotes.
+    """
+    if '"' not in value:
+        return value
+    return _QUOTED_NAME.sub(
+        lambda m: m[0] if _NAME_SPECIALS.intersection(m[1]) else m[1], value
+    )
+
+
+def _part_text(part: email.message.Message) -> str:
+    """Decode the payload of a single text part."""
+    payload = part.get_payload(decode=True)
+    if not isinstance(payload, bytes):
+        return ""
+    text = _decode_bytes(payload, part.get_content_charset())
+    return text.replace("\r\n", "\n")  # compat32 keeps CRLF from 7-bit parts
 
 
 def _extract_body(msg: email.message.Message) -> str:
     """Extract plain-text body from an email message."""
     if not msg.is_multipart():
-        content = msg.get_content()
-        return content if isinstance(content, str) else ""
+        return _part_text(msg) if msg.get_content_maintype() == "text" else ""
 
+    # Single walk: return the first text/plain part, remembering the first
+    # text/html part as a fallback.
+    html_fallback = None
     for part in msg.walk():
-        if part.get_content_type() == "text/plain":
-            content = part.get_content()
-            if isinstance(content, str):
-                return content
+        content_type = part.get_content_type()
+        if content_type == "text/plain":
+            return _part_text(part)
+        elif content_type == "text/html" and html_fallback is None:
+            html_fallback = _part_text(part)
 
     # Fallback: strip HTML tags
-    for part in msg.walk():
-        if part.get_content_type() == "text/html":
-            content = part.get_content()
-            if isinstance(content, str):
-                return _STRIP_HTML.sub("", content)
-
-    return ""
+    return _STRIP_HTML.sub("", html_fallback) if html_fallback else ""
 
 
-def parse_eml(filepath: Path) -> dict[str, str]:
-    """Parse .eml file into subject, from, to, cc, date, body."""
-    with open(filepath, "rb") as f:
-        msg = email.message_from_binary_file(f, policy=policy.default)
-
+def _message_fields(msg: email.message.Message) -> dict[str, str]:
+    """Extract subject, from, to, cc, date, body from a compat32 message."""
+    # compat32 keeps headers as raw strings; only the fields shown in the
+    # PDF are decoded, instead of running policy.default's structured
+    # header parsers on every header.
     return {
-        "subject": str(msg.get("Subject", "")) or "(件名なし)",
-        "from": str(msg.get("From", "")),
-        "to": str(msg.get("To", "")),
-        "cc": str(msg.get("Cc", "")),
-        "date": str(msg.get("Date", "")),
+        "subject": _decode_mime_header(msg.get("Subject")) or "(件名なし)",
+        "from": _unquote_names(_decode_mime_header(msg.get("From"))),
+        "to": _unquote_names(_decode_mime_header(msg.get("To"))),
+        "cc": _unquote_names(_decode_mime_header(msg.get("Cc"))),
+        "date": _decode_mime_header(msg.get("Date")),
         "body": _extract_body(msg).strip(),
     }
 
 
+def parse_eml_bytes(raw: bytes) -> dict[str, str]:
+    """Parse the raw bytes of an .eml file, as :func:`parse_eml`."""
+    # parse() feeds the parser in blocks; parsebytes() decodes the whole
+    # buffer to one str first, tripling the peak for large attachments.
+    return _message_fields(BytesParser(policy=policy.compat32).parse(io.BytesIO(raw)))
+
+
+def parse_eml(filepath: Path) -> dict[str, str]:
+    """Parse .eml file into subject, from, to, cc, date, body."""
+    return parse_eml_bytes(Path(filepath).read_bytes())
+
+
 # ── PDF generation ───────────────────────────
 
 
 def _escape(text: str) -> str:
     """Escape text for reportlab Paragraph markup."""
-    return html.escape(text, quote=False).replace("  ", "&nbsp; ")
+    # Faster than html.escape or str.translate; "&" must be replaced first.
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("  ", "&nbsp; ")
+    )
+
+
+@lru_cache(maxsize=None)
+def _label_markup(label: str) -> str:
+    """Markup for a header label; only a handful of labels exist."""
+    return f'<font color="#888888">{_escape(label)}:</font>&nbsp;&nbsp;'
+
+
+@lru_cache(maxsize=None)
+def _glyph_width(ch: str) -> float:
+    """Width of one character in the body font."""
+    return stringWidth(ch, STYLE_BODY.fontName, STYLE_BODY.fontSize)
+
+
+def _wrap_line(line: str, width: float) -> list[str]:
+    """Hard-wrap *line* so each piece fits *width* in the body font."""
+    # Glyphs are at most 1 em wide, so short lines need no measuring.
+    if len(line) <= width // STYLE_BODY.fontSize:
+        return [line]
+    ends = list(accumulate(map(_glyph_width, line)))
+    if ends[-1] <= width:
+        return [line]
+
+    # Binary-search each break point on the running widths.
+    pieces = []
+    start = 0
+    offset = 0.0
+    while start < len(line):
+        end = max(start + 1, bisect_right(ends, offset + width, start))
+        pieces.append(line[start:end])
+        offset = ends[end - 1]
+        start = end
+    return pieces
+
+
+def _preformatted_body(body: str) -> list:
+    """Lay out a very long body as Preformatted blocks of pre-wrapped lines.
+
+    Preformatted draws its lines as-is, skipping Paragraph's markup parsing
+    and word-wrap layout, which dominate time and memory on huge bodies.
+    """
+    lines = [
+        piece
+        for line in body.expandtabs().split("\n")
+        for piece in _wrap_line(line.rstrip(), BODY_WIDTH)
+    ]
+    # Cut every PREFORMATTED_CHUNK_LINES lines regardless of content; a long
+    # Preformatted is re-split on every page, which grows quadratically.
+    # Preformatted drops blank lines at the edges of its text, so those are
+    # carried as one-line Spacers instead.
+    story: list = []
+    for i in range(0, len(lines), PREFORMATTED_CHUNK_LINES):
+        chunk = lines[i : i + PREFORMATTED_CHUNK_LINES]
+        head, tail = 0, len(chunk)
+        while head < tail and not chunk[head]:
+            head += 1
+        while tail > head and not chunk[tail - 1]:
+            tail -= 1
+        story.extend(Spacer(1, STYLE_BODY.leading) for _ in range(head))
+        if head < tail:
+            story.append(Preformatted("\n".join(chunk[head:tail]), STYLE_BODY))
+        story.extend(Spacer(1, STYLE_BODY.leading) for _ in range(len(chunk) - tail))
+    return story
 
 
 def _build_story(data: dict[str, str]) -> list:
     """Build reportlab flowable list from email data."""
-    story: list = [Paragraph(_escape(data["subject"]), STYLE_SUBJECT)]
-
     headers = [("差出人", data["from"]), ("宛先", data["to"])]
     if data["cc"]:
         headers.append(("CC", data["cc"]))
     headers.append(("日時", data["date"]))
 
-    for label, value in headers:
-        markup = (
-            f'<font color="#888888">{_escape(label)}:</font>'
-            f"&nbsp;&nbsp;{_escape(value)}"
-        )
-        story.append(Paragraph(markup, STYLE_HEADER))
+    header_paras = [
+        Paragraph(_label_markup(label) + _escape(value), STYLE_HEADER)
+        for label, value in headers
+    ]
 
-    story.append(Spacer(1, 5 * mm))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=HexColor("#cccccc")))
-    story.append(Spacer(1, 5 * mm))
-
-    for line in data["body"].split("\n"):
-        if line.strip():
-            story.append(Paragraph(_escape(line), STYLE_BODY))
-        else:
-            story.append(Spacer(1, 3 * mm))
-
-    return story
-
-
-def eml_to_pdf(eml_path: Path, pdf_path: Path) -> None:
-    """Convert a single .eml file to PDF."""
-    data = parse_eml(eml_path)
+    body = data["body"]
+    if len(body) > LONG_BODY_CHARS or body.count("\n") > LONG_BODY_LINES:
+        body_flowables = _preformatted_body(body)
+    else:
+        # Escape the whole body in one call rather than once per line;
+        # escaping never touches "\n", so both splits line up.
+        body_flowables = [
+            Paragraph(escaped, STYLE_BODY)
+            if line.strip()
+            else Spacer(1, GAP_BLANK_LINE)
+            for line, escaped in zip(body.split("\n"), _escape(body).split("\n"))
+        ]
+
+    # Each section is built as its own list and joined once at the end.
+    return [
+        Paragraph(_escape(data["subject"]), STYLE_SUBJECT),
+        *header_paras,
+        Spacer(1, GAP_SECTION),
+        HRFlowable(width="100%", thickness=0.5, color=HR_COLOR),
+        Spacer(1, GAP_SECTION),
+        *body_flowables,
+    ]
+
+
+def render_pdf(data: dict[str, str], pdf_path: Path) -> None:
+    """Render parsed email *data* (see :func:`parse_eml`) to *pdf_path*."""
+    _register_fonts()
     doc = SimpleDocTemplate(
         str(pdf_path),
-        pagesize=A4,
-        topMargin=20 * mm,
-        bottomMargin=20 * mm,
-        leftMargin=20 * mm,
-        rightMargin=20 * mm,
+        **PAGE_LAYOUT,
         title=data["subject"],
         author=data["from"],
     )
-    doc.build(_build_story(data))
+    try:
+        doc.build(_build_story(data))
+    finally:
+        _release_memory()
+
+
+def eml_to_pdf(eml_path: Path, pdf_path: Path) -> None:
+    """Convert a single .eml file to PDF."""
+    render_pdf(parse_eml(eml_path), pdf_path)
+
+
+# ── Memory ───────────────────────────────────
+
+# Pool workers convert many files in one process; reportlab leaves
+# reference cycles behind, so collect them every GC_INTERVAL conversions.
+GC_INTERVAL = 32
+_conversions = 0
+
+# glibc keeps freed arenas mapped, so RSS only grows over a long batch
+# unless they are handed back explicitly.
+_malloc_trim = None
+if sys.platform.startswith("linux"):
+    try:
+        _malloc_trim = ctypes.CDLL("libc.so.6").malloc_trim
+    except (OSError, AttributeError):
+        pass
+
+
+def _release_memory() -> None:
+    """Every GC_INTERVAL conversions, collect garbage and return it to the OS."""
+    global _conversions
+    _conversions += 1
+    if _conversions % GC_INTERVAL == 0:
+        gc.collect()
+        if _malloc_trim is not None:
+            _malloc_trim(0)
 
 
 # ── Batch conversion ─────────────────────────
 
 ProgressCallback = Callable[[int, int, str, bool, str | None], None]
 
+# READ_THREADS threads read files ahead of the parser so the
+# open/read/close round trips overlap instead of running one by one.  Raw
+# files waiting to be parsed are capped at READ_AHEAD_BYTES in total (at
+# least one is always in flight) and released as soon as they are parsed.
+# Parsed messages are handed over for rendering READ_BATCH_SIZE at a time,
+# and at most PARSED_BATCHES_AHEAD parsed batches wait for the render pool.
+READ_BATCH_SIZE = 64
+READ_THREADS = 16
+READ_AHEAD_BYTES = 16 * 1024 * 1024
+PARSED_BATCHES_AHEAD = 2
+
+
+def _put(out: queue.Queue, item: object, stop: threading.Event) -> bool:
+    """Put *item* on *out*, giving up (False) once *stop* is set."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _parse_worker(
+    eml_files: list[Path], out: queue.Queue, stop: threading.Event
+) -> None:
+    """Parse *eml_files* in order, in batches of READ_BATCH_SIZE.
+
+    Each batch is put on *out* as a list of ``(path, data, error, digest)``,
+    where *digest* is the SHA-256 of the raw file.  A file whose content
+    matches an earlier one is not parsed again and has *data* set to None.
+    If the reader itself fails, the exception is put on *out*; ``None``
+    always follows as the last item.  The reader exits early once *stop*
+    is set.
+    """
+    seen: set[str] = set()
+    try:
+        with ThreadPoolExecutor(max_workers=READ_THREADS) as readers:
+            to_read = iter(eml_files)
+            reads: deque[tuple[Path, Future, int]] = deque()
+            ahead = 0
+
+            def read_ahead() -> None:
+                nonlocal ahead
+                while len(reads) < READ_THREADS and (
+                    not reads or ahead < READ_AHEAD_BYTES
+                ):
+                    eml = next(to_read, None)
+                    if eml is None:
+                        return
+                    try:
+                        size = eml.stat().st_size
+                    except OSError:
+                        size = 0  # read_bytes() will report the error
+                    reads.append((eml, readers.submit(eml.read_bytes), size))
+                    ahead += size
+
+            items = []
+            read_ahead()
+            while reads:
+                eml, read, size = reads.popleft()
+                try:
+                    raw = read.result()
+                    del read  # the future would keep the bytes alive
+                    digest = hashlib.sha256(raw).hexdigest()
+                    if digest in seen:
+                        items.append((eml, None, None, digest))
+                    else:
+                        items.append((eml, parse_eml_bytes(raw), None, digest))
+                        seen.add(digest)
+                except (OSError, ValueError) as e:
+                    items.append((eml, None, e, None))
+                except Exception as e:
+                    # Any other parse failure still concerns this file
+                    # only; report it as a per-file error.
+                    err = ValueError(f"{type(e).__name__}: {e}")
+                    err.__cause__ = e
+                    items.append((eml, None, err, None))
+                raw = None
+                ahead -= size
+                read_ahead()
+
+                if len(items) == READ_BATCH_SIZE or not reads:
+                    if not _put(out, items, stop):
+                        return
+                    items = []
+    except BaseException as e:
+        _put(out, e, stop)
+    finally:
+        _put(out, None, stop)
+
+
+def _copy_pdf(source: Path | BaseException, target: Path) -> BaseException | None:
+    """Copy an already rendered PDF to *target*, returning the error if any.
+
+    *source* is the error itself when rendering the original failed.
+    """
+    if isinstance(source, BaseException):
+        return source
+    try:
+        shutil.copyfile(source, target)
+    except OSError as e:
+        return e
+    return None
+
+
+def _convert_all(
+    eml_files: list[Path], dst: Path
+) -> Iterator[tuple[Path, BaseException | None]]:
+    """Convert *eml_files* into *dst*, yielding ``(path, error)`` as each finishes.
+
+    A reader thread parses batches of messages ahead while a process pool
+    renders the PDFs, so reading batch N+1 overlaps with rendering batch N.
+    Both the parse queue and the number of in-flight renders are bounded.
+    Files with identical content (newsletters, cron reports...) are
+    rendered once and the PDF is copied for the others.
+    """
+    parsed: queue.Queue = queue.Queue(maxsize=PARSED_BATCHES_AHEAD)
+    stop = threading.Event()
+    workers = min(len(eml_files), os.cpu_count() or 1)
+    if sys.platform == "win32":
+        # ProcessPoolExecutor rejects more than 61 workers on Windows.
+        workers = min(workers, 61)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_register_fonts) as ex:
+        # The first submit launches the workers, which register the fonts
+        # once each.  Do it before the reader thread exists: forking while
+        # another thread holds a lock can deadlock the child.
+        ex.submit(_register_fonts)
+        threading.Thread(
+            target=_parse_worker, args=(eml_files, parsed, stop), daemon=True
+        ).start()
+
+        pending: dict[Future, tuple[Path, str]] = {}
+        # digest -> rendered PDF (or the render error), and duplicates
+        # waiting for a render that is still in flight.
+        rendered: dict[str, Path | BaseException] = {}
+        waiting: dict[str, list[Path]] = {}
+
+        def settle(future: Future) -> Iterator[tuple[Path, BaseException | None]]:
+            eml, digest = pending.pop(future)
+            err = future.exception()
+            rendered[digest] = err or dst / f"{eml.stem}.pdf"
+            yield eml, err
+            for dup in waiting.pop(digest, []):
+                yield dup, _copy_pdf(rendered[digest], dst / f"{dup.stem}.pdf")
+
+        try:
+            while (items := parsed.get()) is not None:
+                if isinstance(items, BaseException):
+                    raise items
+                for eml, data, err, digest in items:
+                    if err is not None:
+                        yield eml, err
+                        continue
+                    if data is None:
+                        if digest in rendered:
+                            target = dst / f"{eml.stem}.pdf"
+                            yield eml, _copy_pdf(rendered[digest], target)
+                        else:
+                            waiting.setdefault(digest, []).append(eml)
+                        continue
+                    future = ex.submit(render_pdf, data, dst / f"{eml.stem}.pdf")
+                    pending[future] = (eml, digest)
+                    if len(pending) >= 2 * workers:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from settle(future)
+            for future in as_completed(list(pending)):
+                yield from settle(future)
+        finally:
+            # Also reached when the caller stops early: release the reader.
+            stop.set()
+            for future in pending:
+                future.cancel()
+
+
+def _list_eml_files(src: Path) -> list[Path]:
+    """Return the .eml files directly inside *src*, sorted by name."""
+    # os.scandir + sorting plain names avoids building and comparing a Path
+    # per entry, which adds up on folders with 100k+ messages.
+    try:
+        with os.scandir(src) as entries:
+            names = [
+                e.name
+                for e in entries
+                if os.path.normcase(e.name).endswith(".eml") and e.is_file()
+            ]
+    except OSError:
+        return []
+    # normcase folds case on Windows only: there a.EML is the same kind of
+    # file as a.eml, while on POSIX matching it too would let a.eml and
+    # a.EML write the same a.pdf.  The sort folds case the same way.
+    names.sort(key=os.path.normcase)
+    return [src / name for name in names]
+
 
 def batch_convert(
     input_dir: str,
@@ -167,23 +602,27 @@ def batch_convert(
     dst = Path(output_dir)
     dst.mkdir(parents=True, exist_ok=True)
 
-    eml_files = sorted(src.glob("*.eml"))
+    eml_files = _list_eml_files(src)
     if not eml_files:
         return 0, 0, ".eml ファイルが見つかりません"
 
     total = len(eml_files)
     ok = ng = 0
 
-    for i, eml in enumerate(eml_files, 1):
-        try:
-            eml_to_pdf(eml, dst / f"{eml.stem}.pdf")
-            ok += 1
-            if on_progress:
-                on_progress(i, total, eml.name, True, None)
-        except (OSError, ValueError) as e:
-            ng += 1
-            if on_progress:
-                on_progress(i, total, eml.name, False, str(e))
+    # closing() stops the reader thread and pool right away if this loop
+    # is left by an exception (e.g. raised from on_progress).
+    with closing(_convert_all(eml_files, dst)) as results:
+        for i, (eml, err) in enumerate(results, 1):
+            try:
+                if err is not None:
+                    raise err
+                ok += 1
+                if on_progress:
+                    on_progress(i, total, eml.name, True, None)
+            except (OSError, ValueError) as e:
+                ng += 1
+                if on_progress:
+                    on_progress(i, total, eml.name, False, str(e))
 
     summary = f"完了: {ok}/{total} 件成功"
     if ng:
@@ -193,9 +632,10 @@ def batch_convert(
 
 # ── GUI ──────────────────────────────────────
 
+PROGRESS_INTERVAL_MS = 100
+
 
 def _run_gui() -> None:
-    import threading
     import tkinter as tk
     from tkinter import filedialog, messagebox, ttk
 
@@ -210,6 +650,11 @@ def _run_gui() -> None:
             self.output_dir = tk.StringVar()
             self._build(root)
 
+            # Progress from the worker thread is queued here and applied to
+            # the widgets every PROGRESS_INTERVAL_MS, not once per file.
+            self._progress: deque[tuple[int, int, str]] = deque()
+            root.after(PROGRESS_INTERVAL_MS, self._flush_progress)
+
         def _build(self, root: tk.Tk) -> None:
             main = ttk.Frame(root, padding=20)
             main.pack(fill=tk.BOTH, expand=True)
@@ -259,6 +704,21 @@ def _run_gui() -> None:
             self.log.insert(tk.END, msg + "\n")
             self.log.see(tk.END)
 
+        def _drain_progress(self) -> None:
+            if not self._progress:
+                return
+            msgs = []
+            while self._progress:
+                i, total, msg = self._progress.popleft()
+                msgs.append(msg)
+            self.pvar.set(i / total * 100)
+            self.status.set(f"{i} / {total} 件処理中...")
+            self._append_log("\n".join(msgs))
+
+        def _flush_progress(self) -> None:
+            self._drain_progress()
+            self.root.after(PROGRESS_INTERVAL_MS, self._flush_progress)
+
         def _pick_input(self) -> None:
             if p := filedialog.askdirectory(title="入力フォルダを選択"):
                 self.input_dir.set(p)
@@ -283,12 +743,11 @@ def _run_gui() -> None:
             def on_progress(i: int, total: int, name: str, ok: bool, err: str | None) -> None:
                 mark = "✓" if ok else "✗"
                 detail = f"  ({err})" if err else ""
-                self._after(lambda: self.pvar.set(i / total * 100))
-                self._after(lambda: self.status.set(f"{i} / {total} 件処理中..."))
-                self._after(lambda m=f"{mark} {name}{detail}": self._append_log(m))
+                self._progress.append((i, total, f"{mark} {name}{detail}"))
 
             try:
                 ok, _, summary = batch_convert(src, dst, on_progress)
+                self._after(self._drain_progress)
                 self._after(lambda: self.status.set(summary))
                 self._after(lambda: self._append_log(f"\n{summary}\n出力先: {dst}"))
                 if ok: